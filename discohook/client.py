@@ -1,21 +1,136 @@
 import logging
 import json
+import gzip
+import os
 import time
+import random
 import datetime
+import contextlib
 import requests
 import aiohttp
 import asyncio
+from requests.adapters import HTTPAdapter
+
+try:
+    from requests_toolbelt import MultipartEncoder
+except ImportError:  # optional, lets sync uploads stream instead of being built in memory
+    MultipartEncoder = None
+
+try:
+    import orjson
+except ImportError:  # optional, faster json encoding/decoding
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
 __all__ = ["Discohook", "DiscohookEmbed"]
 
+# shared session so keep-alive connections to Discord are reused between calls
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=100))
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+_GZIP_JSON_HEADERS = {"Content-Type": "application/json", "Content-Encoding": "gzip"}
+# payloads smaller than this are sent uncompressed when `gzip_payload` is enabled
+_GZIP_MIN_SIZE = 1024
+
+_UTC = datetime.timezone.utc
+
+# webhook attributes sent to Discord as is, embeds are converted separately
+_PAYLOAD_KEYS = ("content", "username", "avatar_url", "tts", "allowed_mentions")
+
+# python 3.12+, starts tasks right away instead of on the next event loop iteration
+_eager_task_factory = getattr(asyncio, "eager_task_factory", None)
+
+# exponential backoff between rate limited retries, in seconds
+_BACKOFF_BASE = 0.5
+_BACKOFF_MAX = 30
+
+
+if orjson is not None:
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+else:
+    def _dumps(obj):
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+    _loads = json.loads
+
+
+def _client_session(limit):
+    """
+    Creates an aiohttp session tuned for posting webhooks
+    Discord's responses are small json bodies, ask for them uncompressed and skip
+    the decompression step, aiohttp already sets TCP_NODELAY on its connections
+    - param limit : max number of simultaneous connections
+    - return : `aiohttp.ClientSession`
+    """
+    return aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit=limit, ttl_dns_cache=300),
+        headers={"Accept-Encoding": "identity"},
+        auto_decompress=False,
+    )
+
+
+def _gather(coros, return_exceptions=False):
+    """
+    Like `asyncio.gather`, but starts each coroutine eagerly when the python version supports it
+    - param coros : iterable of coroutines
+    - param return_exceptions : if set to True, exceptions are returned as results instead of raised
+    - return : awaitable of the results, in the same order as `coros`
+    """
+    if _eager_task_factory is None:
+        return asyncio.gather(*coros, return_exceptions=return_exceptions)
+    loop = asyncio.get_running_loop()
+    return asyncio.gather(*[_eager_task_factory(loop, coro) for coro in coros],
+                          return_exceptions=return_exceptions)
+
+
+def _seekable(file):
+    """
+    Checks whether a file object can be rewound, pipes and sockets can only be read once
+    """
+    try:
+        return file.seekable()
+    except (AttributeError, OSError, ValueError):
+        return False
+
+
+async def _iter_chunks(file, chunk_size=64 * 1024):
+    """
+    Yields a file object in chunks so aiohttp can stream it without taking ownership of it
+    Reads run in the default executor so disk or socket backed files don't block the event loop
+    """
+    loop = asyncio.get_running_loop()
+    chunk = await loop.run_in_executor(None, file.read, chunk_size)
+    while chunk:
+        yield chunk
+        chunk = await loop.run_in_executor(None, file.read, chunk_size)
+
+
+class _MockResponse:
+    """
+    Minimal stand-in for `requests.Response` returned by the async methods
+    """
+
+    __slots__ = ("status_code", "content", "url", "headers", "message_id")
+
+    def __init__(self, status_code, content, url, headers):
+        self.status_code = status_code
+        self.content = content
+        self.url = url
+        self.headers = headers
+        self.message_id = None
+
 
 class Discohook:
     """
     Webhook for Discord
     """
 
+    # requests.Session used by the sync methods, override to inject your own
+    session = _SESSION
+
     def __init__(self, url, **kwargs):
         """
         Init Discohook
@@ -25,40 +140,72 @@ class Discohook:
         - keyword username : override the default username of the webhook
         - keyword avatar_url : override the default avatar of the webhook
         - keyword tts : true if this is a TTS message
-        - keyword file : file contents
-        - keyword filename : file name
+        - keyword files : list of (filename, file) tuples, see `add_file`
         - keyword embeds : list of embedded rich content
         - keyword allowed_mentions : allowed mentions for the message
         - keyword proxies : dict of proxies
         - keyword timeout : (optional) amount of seconds to wait for a response from Discord
+        - keyword rate_limit_retry : retry the request when rate limited by Discord
+        - keyword rate_limit_max_retries : (optional) how many times to retry a rate limited request, defaults to 5
+        - keyword gzip_payload : (optional) gzip json payloads larger than 1KB before sending them
         """
         self.url = url
         self.content = kwargs.get("content")
         self.username = kwargs.get("username")
         self.avatar_url = kwargs.get("avatar_url")
         self.tts = kwargs.get("tts", False)
-        self.files = kwargs.get("files", dict())
+        files = kwargs.get("files", [])
+        self.files = list(files.values() if isinstance(files, dict) else files)
         self.embeds = kwargs.get("embeds", [])
         self.proxies = kwargs.get("proxies")
         self.allowed_mentions = kwargs.get("allowed_mentions")
         self.timeout = kwargs.get("timeout")
         self.rate_limit_retry = kwargs.get("rate_limit_retry")
+        self.rate_limit_max_retries = kwargs.get("rate_limit_max_retries", 5)
+        self.gzip_payload = kwargs.get("gzip_payload", False)
+        self._session = None
+        self._session_loop = None
+
+    async def __aenter__(self):
+        """
+        Opens an aiohttp session that `aexecute` reuses until the block exits
+        """
+        if self._session is None or self._session.closed:
+            self._session = _client_session(100)
+            self._session_loop = asyncio.get_running_loop()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
+
+    async def aclose(self):
+        """
+        Closes the aiohttp session opened by `async with`, if any
+        """
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        self._session_loop = None
 
     def add_file(self, file, filename):
         """
         Adds a file to the webhook
-        - param file : `file content`
+        - param file : `file content` as bytes or str, `os.PathLike` path to the file or binary file object
         - param filename : `filename`
         - return :
+        Paths (e.g. `pathlib.Path`) are opened when the webhook is sent and streamed from disk, plain
+        strings are always sent as content, file objects are streamed from their current position
+        and rewound after each request. Pipes and other file objects that can't be rewound are read
+        once, so they can only be sent to a single url and aren't retried when rate limited
         """
-        self.files["_{}".format(filename)] = (filename, file)
+        self.files.append((filename, file))
 
     def add_embed(self, embed):
         """
         Adds an embedded rich content
         - param embed : embed object or dict
         """
-        self.embeds.append(embed.__dict__ if isinstance(embed, DiscohookEmbed) else embed)
+        self.embeds.append(embed.to_dict() if isinstance(embed, DiscohookEmbed) else embed)
 
     def remove_embed(self, index):
         """
@@ -72,9 +219,7 @@ class Discohook:
         Removes file from `self.files` using specified `filename` if it exists
         - param filename : `filename`
         """
-        filename = "_{}".format(filename)
-        if filename in self.files:
-            del self.files[filename]
+        self.files = [f for f in self.files if f[0] != filename]
 
     def get_embeds(self):
         """
@@ -105,19 +250,12 @@ class Discohook:
         Convert webhook data to json
         - return webhook data as json
         """
-        data = dict()
-        embeds = self.embeds
-        self.embeds = list()
-        # convert DiscohookEmbed to dict
-        for embed in embeds:
-            self.add_embed(embed)
-        for key, value in self.__dict__.items():
-            if value and key not in ["url", "files", "filename"]:
-                data[key] = value
-        embeds_empty = (
-            all(not embed for embed in data["embeds"]) if "embeds" in data else True
-        )
-        if embeds_empty and "content" not in data and bool(self.files) is False:
+        data = {key: value for key in _PAYLOAD_KEYS if (value := getattr(self, key))}
+        # convert DiscohookEmbed to dict without touching `self.embeds`
+        embeds = [embed.to_dict() if isinstance(embed, DiscohookEmbed) else embed for embed in self.embeds]
+        if embeds:
+            data["embeds"] = embeds
+        if not any(embeds) and "content" not in data and not self.files:
             logger.error("Webhook message is empty! set content or embed data")
         return data
 
@@ -129,64 +267,213 @@ class Discohook:
 
     def remove_files(self):
         """
-        Sets `self.files` to empty `dict`.
+        Sets `self.files` to empty `list`.
+        """
+        self.files = []
+
+    def _encode_payload(self):
+        """
+        Serializes `self.json` once so it can be sent to several urls
+        - return : tuple of (payload bytes, json request headers), the payload is gzipped
+        if `self.gzip_payload` is set and no files are attached
+        """
+        payload_bytes = _dumps(self.json)
+        if self.gzip_payload and not self.files and len(payload_bytes) > _GZIP_MIN_SIZE:
+            return gzip.compress(payload_bytes, 1), _GZIP_JSON_HEADERS
+        return payload_bytes, _JSON_HEADERS
+
+    def _open_files(self, stack):
+        """
+        Gets `self.files` ready to be streamed by requests, opening paths and rewinding file objects on exit
+        - param stack : `contextlib.ExitStack` the opened files are registered on
+        - return : list of (field, (filename, file)) tuples
+        """
+        fields = []
+        for i, (filename, file) in enumerate(self.files):
+            if isinstance(file, os.PathLike):
+                file = stack.enter_context(open(file, "rb"))
+            elif _seekable(file):
+                stack.callback(file.seek, file.tell())
+            fields.append(("files[{}]".format(i), (filename, file)))
+        return fields
+
+    def _has_file_objects(self):
+        """
+        Checks whether `self.files` holds file objects, which can't be read by several requests at once
+        """
+        return any(
+            not isinstance(file, (bytes, bytearray, str, os.PathLike))
+            for _, file in self.files
+        )
+
+    def _has_unseekable_files(self):
+        """
+        Checks whether `self.files` holds file objects that can't be rewound, like pipes or sockets,
+        which can only be sent in a single request
         """
-        self.files = {}
+        return any(
+            not isinstance(file, (bytes, bytearray, str, os.PathLike)) and not _seekable(file)
+            for _, file in self.files
+        )
+
+    def _check_resendable(self, count):
+        """
+        Raises ValueError if the files have to be sent in several requests but some can only be read once
+        - param count : number of requests the files are sent in
+        """
+        if count > 1 and self._has_unseekable_files():
+            raise ValueError("file objects that can't be rewound, like pipes or sockets, "
+                             "can only be sent to a single url")
 
-    def api_post_request(self, url):
-        if bool(self.files) is False:
-            response = requests.post(url, json=self.json, proxies=self.proxies,
-                                     params={'wait': True},
-                                     timeout=self.timeout)
+    def _request_with_files(self, method, url, payload_bytes, **kwargs):
+        """
+        Sends `self.files` as multipart/form-data, streamed when requests_toolbelt is installed
+        - param method : http method
+        - param url : url to send the files to
+        - param payload_bytes : encoded `self.json`, sent as the `payload_json` field
+        - return : Webhook response
+        """
+        with contextlib.ExitStack() as stack:
+            fields = self._open_files(stack)
+            fields.append(("payload_json", (None, payload_bytes)))
+            # MultipartEncoder needs the length of every part, which pipes and sockets can't tell
+            if MultipartEncoder is None or self._has_unseekable_files():
+                return self.session.request(method, url, files=fields, **kwargs)
+            encoder = MultipartEncoder(fields=fields)
+            return self.session.request(method, url, data=encoder,
+                                        headers={"Content-Type": encoder.content_type}, **kwargs)
+
+    def api_post_request(self, url, payload_bytes=None, headers=_JSON_HEADERS):
+        if payload_bytes is None:
+            payload_bytes, headers = self._encode_payload()
+        if not self.files:
+            response = self.session.post(url, data=payload_bytes, headers=headers,
+                                         proxies=self.proxies,
+                                         params={'wait': True},
+                                         timeout=self.timeout)
         else:
-            self.files["payload_json"] = (None, json.dumps(self.json))
-            response = requests.post(url, files=self.files,
-                                     proxies=self.proxies,
-                                     timeout=self.timeout)
+            response = self._request_with_files("POST", url, payload_bytes,
+                                                proxies=self.proxies,
+                                                timeout=self.timeout)
 
         return response
 
-    async def api_post_request_async(self, session, url):
+    def _form_data(self, payload_bytes, stack):
+        """
+        Builds the multipart form sent by `api_post_request_async`
+        - param payload_bytes : encoded `self.json`
+        - param stack : `contextlib.ExitStack` the opened files are registered on
+        - return : `aiohttp.FormData`
+        """
+        data = aiohttp.FormData()
+        data.add_field('payload_json', payload_bytes.decode('utf-8'))
+        for i, (filename, file) in enumerate(self.files):
+            if isinstance(file, os.PathLike):
+                file = stack.enter_context(open(file, "rb"))
+            elif hasattr(file, "read"):
+                # aiohttp closes the file objects it is given, so hand it chunks instead
+                if _seekable(file):
+                    stack.callback(file.seek, file.tell())
+                file = _iter_chunks(file)
+            data.add_field("files[{}]".format(i), file, filename=filename)
+        return data
+
+    async def _encode_form_data(self, payload_bytes):
+        """
+        Encodes the multipart body once so it can be posted to several urls
+        Only done when every file is already in memory, paths and file objects keep being streamed
+        - param payload_bytes : encoded `self.json`
+        - return : tuple of (body, content type), or None if the form has to be streamed
+        """
+        if any(not isinstance(file, (bytes, bytearray, str)) for _, file in self.files):
+            return None
+        with contextlib.ExitStack() as stack:
+            writer = self._form_data(payload_bytes, stack)()
+            return await writer.as_bytes(), writer.content_type
+
+    async def api_post_request_async(self, session, url, payload_bytes=None, headers=_JSON_HEADERS,
+                                     encoded_form=None):
         """
         Async version of api_post_request using aiohttp
+        - param headers : (optional) json request headers returned by `_encode_payload` with `payload_bytes`
+        - param encoded_form : (optional) multipart body and content type from `_encode_form_data`
         """
-        if bool(self.files) is False:
+        if payload_bytes is None:
+            payload_bytes, headers = self._encode_payload()
+        if not self.files:
             async with session.post(
                     url,
-                    json=self.json,
+                    data=payload_bytes,
+                    headers=headers,
                     params={'wait': 'true'},
-                    timeout=aiohttp.ClientTimeout(total=self.timeout)
+                    timeout=aiohttp.ClientTimeout(total=self.timeout),
+                    allow_redirects=False
             ) as response:
                 response_data = await response.read()
-                # Create a mock response object similar to requests.Response
-                mock_response = type('MockResponse', (), {
-                    'status_code': response.status,
-                    'content': response_data,
-                    'url': str(response.url)
-                })()
-                return mock_response
-        else:
-            # Prepare form data for file upload
-            data = aiohttp.FormData()
-            data.add_field('payload_json', json.dumps(self.json))
-
-            for key, (filename, file_content) in self.files.items():
-                if key != 'payload_json':
-                    data.add_field(key.lstrip('_'), file_content, filename=filename)
-
+                return _MockResponse(response.status, response_data, str(response.url), response.headers)
+        elif encoded_form is not None:
+            body, content_type = encoded_form
             async with session.post(
                     url,
-                    data=data,
-                    timeout=aiohttp.ClientTimeout(total=self.timeout)
+                    data=body,
+                    headers={"Content-Type": content_type},
+                    timeout=aiohttp.ClientTimeout(total=self.timeout),
+                    allow_redirects=False
             ) as response:
                 response_data = await response.read()
-                # Create a mock response object similar to requests.Response
-                mock_response = type('MockResponse', (), {
-                    'status_code': response.status,
-                    'content': response_data,
-                    'url': str(response.url)
-                })()
-                return mock_response
+                return _MockResponse(response.status, response_data, str(response.url), response.headers)
+        else:
+            # Prepare form data for file upload, aiohttp streams file objects in chunks
+            with contextlib.ExitStack() as stack:
+                async with session.post(
+                        url,
+                        data=self._form_data(payload_bytes, stack),
+                        timeout=aiohttp.ClientTimeout(total=self.timeout),
+                        allow_redirects=False
+                ) as response:
+                    response_data = await response.read()
+                    return _MockResponse(response.status, response_data, str(response.url), response.headers)
+
+    @staticmethod
+    def _retry_delay(response, attempt):
+        """
+        Gets how long to wait before retrying a rate limited request
+        - param response : the 429 response
+        - param attempt : number of retries already made
+        - return : delay in seconds
+        """
+        reset_after = response.headers.get("X-RateLimit-Reset-After")
+        if reset_after is not None:
+            retry_after = float(reset_after)
+        else:
+            retry_after = float(_loads(response.content)['retry_after']) / 1000
+        backoff = min(_BACKOFF_BASE * 2 ** attempt, _BACKOFF_MAX)
+        return max(retry_after, backoff) + random.uniform(0, 0.2)
+
+    def _execute_one(self, url, index, length, payload_bytes, headers):
+        """
+        Posts the payload to a single url, retrying on rate limits if enabled
+        - return : Webhook response
+        """
+        response = self.api_post_request(url, payload_bytes, headers)
+        if response.status_code == 429 and self.rate_limit_retry and self._has_unseekable_files():
+            logger.error("Webhook rate limited: not retrying, the attached file objects can't be rewound")
+        elif response.status_code == 429 and self.rate_limit_retry:
+            for attempt in range(self.rate_limit_max_retries):
+                wh_sleep = self._retry_delay(response, attempt)
+                logger.error("Webhook rate limited: sleeping for %s seconds...", wh_sleep)
+                time.sleep(wh_sleep)
+                response = self.api_post_request(url, payload_bytes, headers)
+                if response.status_code != 429:
+                    break
+        if response.status_code in (200, 204):
+            logger.debug("[%d/%d] Webhook executed", index + 1, length)
+        else:
+            logger.error(
+                "[%d/%d] Webhook status code %d: %s",
+                index + 1, length, response.status_code, response.content.decode("utf-8"),
+            )
+        return response
 
     def execute(self, remove_embeds=False, remove_files=False):
         """
@@ -195,117 +482,141 @@ class Discohook:
         - param remove_files : if set to True, calls `self.remove_files()` to empty `self.files` after webhook is executed
         - return : Webhook response
         """
-        webhook_urls = self.url if isinstance(self.url, list) else [self.url]
-        urls_len = len(webhook_urls)
-        responses = []
-        for i, url in enumerate(webhook_urls):
-            response = self.api_post_request(url)
-            if response.status_code in [200, 204]:
-                logger.debug(
-                    "[{index}/{length}] Webhook executed".format(
-                        index=i + 1, length=urls_len
-                    )
-                )
-            elif response.status_code == 429 and self.rate_limit_retry:
-                while response.status_code == 429:
-                    errors = json.loads(
-                        response.content.decode('utf-8'))
-                    wh_sleep = (int(errors['retry_after']) / 1000) + 0.15
-                    time.sleep(wh_sleep)
-                    logger.error(
-                        "Webhook rate limited: sleeping for {wh_sleep} "
-                        "seconds...".format(
-                            wh_sleep=wh_sleep
-                        )
-                    )
-                    response = self.api_post_request(url)
-                    if response.status_code in [200, 204]:
-                        logger.debug(
-                            "[{index}/{length}] Webhook executed".format(
-                                index=i + 1, length=urls_len
-                            )
-                        )
-                        break
-            else:
-                logger.error(
-                    "[{index}/{length}] Webhook status code {status_code}: {content}".format(
-                        index=i + 1,
-                        length=urls_len,
-                        status_code=response.status_code,
-                        content=response.content.decode("utf-8"),
-                    )
-                )
-            responses.append(response)
+        payload_bytes, headers = self._encode_payload()
+        if isinstance(self.url, str):
+            response = self._execute_one(self.url, 0, 1, payload_bytes, headers)
+        else:
+            urls_len = len(self.url)
+            self._check_resendable(urls_len)
+            responses = [
+                self._execute_one(url, i, urls_len, payload_bytes, headers)
+                for i, url in enumerate(self.url)
+            ]
+            response = responses[0] if urls_len == 1 else responses
         if remove_embeds:
             self.remove_embeds()
         if remove_files:
             self.remove_files()
-        return responses[0] if len(responses) == 1 else responses
+        return response
+
+    async def _aexecute_one(self, session, url, index, length, payload_bytes, headers, encoded_form=None):
+        """
+        Posts the payload to a single url, retrying on rate limits if enabled
+        - return : Webhook response
+        """
+        response = await self.api_post_request_async(session, url, payload_bytes, headers, encoded_form)
+        if response.status_code == 429 and self.rate_limit_retry and self._has_unseekable_files():
+            logger.error("Webhook rate limited: not retrying, the attached file objects can't be rewound")
+        elif response.status_code == 429 and self.rate_limit_retry:
+            for attempt in range(self.rate_limit_max_retries):
+                wh_sleep = self._retry_delay(response, attempt)
+                logger.error("Webhook rate limited: sleeping for %s seconds...", wh_sleep)
+                await asyncio.sleep(wh_sleep)
+                response = await self.api_post_request_async(session, url, payload_bytes, headers, encoded_form)
+                if response.status_code != 429:
+                    break
+        if response.status_code in (200, 204):
+            logger.debug("[%d/%d] Webhook executed", index + 1, length)
+        else:
+            logger.error(
+                "[%d/%d] Webhook status code %d: %s",
+                index + 1, length, response.status_code, response.content.decode("utf-8"),
+            )
+        return response
 
     async def aexecute(self, remove_embeds=False, remove_files=False):
         """
-        Async version of execute using aiohttp
+        Async version of execute using aiohttp, all urls are posted to concurrently
+        Each call opens its own `aiohttp.ClientSession`, unless it runs inside
+        `async with Discohook(...) as webhook:`, where one session is shared until the block exits
+        If posting to a url raises, the other urls are still awaited before the first exception is raised
         - param remove_embeds : if set to True, calls `self.remove_embeds()` to empty `self.embeds` after webhook is executed
         - param remove_files : if set to True, calls `self.remove_files()` to empty `self.files` after webhook is executed
         - return : Webhook response
         """
-        webhook_urls = self.url if isinstance(self.url, list) else [self.url]
-        urls_len = len(webhook_urls)
-        responses = []
-
-        # Create connector with proxy support if needed
-        connector = None
-        if self.proxies:
-            connector = aiohttp.TCPConnector()
-
-        async with aiohttp.ClientSession(
-                connector=connector,
-                timeout=aiohttp.ClientTimeout(total=self.timeout)
-        ) as session:
-            for i, url in enumerate(webhook_urls):
-                response = await self.api_post_request_async(session, url)
-
-                if response.status_code in [200, 204]:
-                    logger.debug(
-                        "[{index}/{length}] Webhook executed".format(
-                            index=i + 1, length=urls_len
-                        )
-                    )
-                elif response.status_code == 429 and self.rate_limit_retry:
-                    while response.status_code == 429:
-                        errors = json.loads(response.content.decode('utf-8'))
-                        wh_sleep = (int(errors['retry_after']) / 1000) + 0.15
-                        await asyncio.sleep(wh_sleep)
-                        logger.error(
-                            "Webhook rate limited: sleeping for {wh_sleep} "
-                            "seconds...".format(
-                                wh_sleep=wh_sleep
-                            )
-                        )
-                        response = await self.api_post_request_async(session, url)
-                        if response.status_code in [200, 204]:
-                            logger.debug(
-                                "[{index}/{length}] Webhook executed".format(
-                                    index=i + 1, length=urls_len
-                                )
-                            )
-                            break
-                else:
-                    logger.error(
-                        "[{index}/{length}] Webhook status code {status_code}: {content}".format(
-                            index=i + 1,
-                            length=urls_len,
-                            status_code=response.status_code,
-                            content=response.content.decode("utf-8"),
-                        )
-                    )
-                responses.append(response)
+        if self._session is None or self._session.closed:
+            async with _client_session(100) as session:
+                return await self._aexecute_with_session(session, remove_embeds, remove_files)
+        if self._session_loop is not asyncio.get_running_loop():
+            raise RuntimeError(
+                "Discohook session was opened in another event loop, "
+                "enter `async with` from the loop that calls aexecute"
+            )
+        return await self._aexecute_with_session(self._session, remove_embeds, remove_files)
+
+    @classmethod
+    async def abatch(cls, hooks, concurrency=20, remove_embeds=False, remove_files=False):
+        """
+        Executes several webhooks over a single aiohttp session
+        - param hooks : list of `Discohook`
+        - param concurrency : max number of webhooks being executed at once
+        - param remove_embeds : if set to True, calls `remove_embeds()` on every webhook after it is executed
+        - param remove_files : if set to True, calls `remove_files()` on every webhook after it is executed
+        - return : list of webhook responses, in the same order as `hooks`
+        Every webhook is awaited before the session is closed, a webhook that raises doesn't stop
+        the others and its exception is returned in its slot of the list instead of being raised
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def run(hook):
+            async with semaphore:
+                return await hook._aexecute_with_session(session, remove_embeds, remove_files)
+
+        async with _client_session(concurrency) as session:
+            return await _gather(map(run, hooks), return_exceptions=True)
+
+    async def _aexecute_with_session(self, session, remove_embeds=False, remove_files=False):
+        """
+        Body of `aexecute`, posting through the given aiohttp session
+        - param session : `aiohttp.ClientSession`
+        - return : Webhook response
+        """
+        payload_bytes, headers = self._encode_payload()
+        if isinstance(self.url, str):
+            response = await self._aexecute_one(session, self.url, 0, 1, payload_bytes, headers)
+        else:
+            urls_len = len(self.url)
+            self._check_resendable(urls_len)
+            if self._has_file_objects():
+                # a file object can only be streamed to one url at a time
+                responses = [
+                    await self._aexecute_one(session, url, i, urls_len, payload_bytes, headers)
+                    for i, url in enumerate(self.url)
+                ]
+            else:
+                # build the multipart body once instead of once per url
+                encoded_form = await self._encode_form_data(payload_bytes) if self.files else None
+                # gather keeps responses in the same order as `self.url`, every post is awaited
+                # before raising so the session isn't closed under the ones still in flight
+                responses = await _gather(
+                    (self._aexecute_one(session, url, i, urls_len, payload_bytes, headers, encoded_form)
+                     for i, url in enumerate(self.url)),
+                    return_exceptions=True,
+                )
+                for response in responses:
+                    if isinstance(response, BaseException):
+                        raise response
+            response = responses[0] if urls_len == 1 else responses
 
         if remove_embeds:
             self.remove_embeds()
         if remove_files:
             self.remove_files()
-        return responses[0] if len(responses) == 1 else responses
+        return response
+
+    @staticmethod
+    def _message_url(sent_webhook):
+        """
+        Gets the url of a sent message, the message id is parsed once and cached on the response
+        - param sent_webhook : webhook.execute() response
+        - return : message url
+        """
+        message_id = getattr(sent_webhook, "message_id", None)
+        if message_id is None:
+            message_id = _loads(sent_webhook.content)['id']
+            sent_webhook.message_id = message_id
+        base_url = sent_webhook.url.split('?')[0]  # removes any query params
+        return f"{base_url}/messages/{message_id}"
 
     def edit(self, sent_webhook):
         """
@@ -316,31 +627,22 @@ class Discohook:
         sent_webhook = sent_webhook if isinstance(sent_webhook, list) else [sent_webhook]
         webhook_len = len(sent_webhook)
         responses = []
+        self._check_resendable(webhook_len)
+        payload_bytes, headers = self._encode_payload()
         for i, webhook in enumerate(sent_webhook):
-            url = webhook.url.split('?')[0]  # removes any query params
-            previous_sent_message_id = json.loads(webhook.content.decode('utf-8'))['id']
-            if bool(self.files) is False:
-                response = requests.patch(url + '/messages/' + str(previous_sent_message_id), json=self.json,
-                                          proxies=self.proxies, params={'wait': True}, timeout=self.timeout)
+            message_url = self._message_url(webhook)
+            if not self.files:
+                response = self.session.patch(message_url, data=payload_bytes, headers=headers,
+                                              proxies=self.proxies, params={'wait': True}, timeout=self.timeout)
             else:
-                self.files["payload_json"] = (None, json.dumps(self.json))
-                response = requests.patch(url + '/messages/' + str(previous_sent_message_id), files=self.files,
-                                          proxies=self.proxies, timeout=self.timeout)
-            if response.status_code in [200, 204]:
-                logger.debug(
-                    "[{index}/{length}] Webhook edited".format(
-                        index=i + 1,
-                        length=webhook_len,
-                    )
-                )
+                response = self._request_with_files("PATCH", message_url, payload_bytes,
+                                                    proxies=self.proxies, timeout=self.timeout)
+            if response.status_code in (200, 204):
+                logger.debug("[%d/%d] Webhook edited", i + 1, webhook_len)
             else:
                 logger.error(
-                    "[{index}/{length}] Webhook status code {status_code}: {content}".format(
-                        index=i + 1,
-                        length=webhook_len,
-                        status_code=response.status_code,
-                        content=response.content.decode("utf-8"),
-                    )
+                    "[%d/%d] Webhook status code %d: %s",
+                    i + 1, webhook_len, response.status_code, response.content.decode("utf-8"),
                 )
             responses.append(response)
         return responses[0] if len(responses) == 1 else responses
@@ -355,25 +657,14 @@ class Discohook:
         webhook_len = len(sent_webhook)
         responses = []
         for i, webhook in enumerate(sent_webhook):
-            url = webhook.url.split('?')[0]  # removes any query params
-            previous_sent_message_id = json.loads(webhook.content.decode('utf-8'))['id']
-            response = requests.delete(url + '/messages/' + str(previous_sent_message_id), proxies=self.proxies,
-                                       timeout=self.timeout)
-            if response.status_code in [200, 204]:
-                logger.debug(
-                    "[{index}/{length}] Webhook deleted".format(
-                        index=i + 1,
-                        length=webhook_len,
-                    )
-                )
+            response = self.session.delete(self._message_url(webhook), proxies=self.proxies,
+                                           timeout=self.timeout)
+            if response.status_code in (200, 204):
+                logger.debug("[%d/%d] Webhook deleted", i + 1, webhook_len)
             else:
                 logger.error(
-                    "[{index}/{length}] Webhook status code {status_code}: {content}".format(
-                        index=i + 1,
-                        length=webhook_len,
-                        status_code=response.status_code,
-                        content=response.content.decode("utf-8"),
-                    )
+                    "[%d/%d] Webhook status code %d: %s",
+                    i + 1, webhook_len, response.status_code, response.content.decode("utf-8"),
                 )
             responses.append(response)
         return responses[0] if len(responses) == 1 else responses
@@ -384,6 +675,9 @@ class DiscohookEmbed:
     Discord Embed
     """
 
+    __slots__ = ("title", "description", "url", "timestamp", "color", "footer",
+                 "image", "thumbnail", "video", "provider", "author", "fields")
+
     def __init__(self, **kwargs):
         """
         Init Discord Embed
@@ -391,8 +685,8 @@ class DiscohookEmbed:
         - keyword description : description of embed
         - keyword url : url of embed
         - keyword timestamp : timestamp of embed content
-        - keyword color : color code of the embed as int
-        - keyword hex_color : color code of the embed as a hex string
+        - keyword color : color code of the embed as int or hex string
+        - keyword hex_color : color code of the embed as a hex string, used when `color` isn't set
         - keyword footer : footer information
         - keyword image : image information
         - thumbnail : thumbnail information
@@ -405,10 +699,8 @@ class DiscohookEmbed:
         self.description = kwargs.get("description")
         self.url = kwargs.get("url")
         self.timestamp = kwargs.get("timestamp")
-        self.color = kwargs.get("color")
-        if self.color:
-            self.set_color(self.color)
-        self.hex_color = kwargs.get("hex_color")
+        color = kwargs.get("color", kwargs.get("hex_color"))
+        self.color = int(color, 16) if isinstance(color, str) else color
         self.footer = kwargs.get("footer")
         self.image = kwargs.get("image")
         self.thumbnail = kwargs.get("thumbnail")
@@ -417,6 +709,13 @@ class DiscohookEmbed:
         self.author = kwargs.get("author")
         self.fields = kwargs.get("fields", [])
 
+    def to_dict(self):
+        """
+        Convert embed to dict, leaving out unset fields
+        - return : embed data as dict
+        """
+        return {key: getattr(self, key) for key in self.__slots__ if getattr(self, key) is not None}
+
     def set_title(self, title):
         """
         Set title of embed
@@ -445,7 +744,7 @@ class DiscohookEmbed:
         """
         if timestamp is None:
             timestamp = time.time()
-        self.timestamp = str(datetime.datetime.utcfromtimestamp(timestamp))
+        self.timestamp = datetime.datetime.fromtimestamp(timestamp, _UTC).isoformat()
 
     def set_color(self, color):
         """
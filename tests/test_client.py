@@ -0,0 +1,90 @@
+import asyncio
+import os
+import unittest
+
+import aiohttp
+from aiohttp import web
+
+from discohook import Discohook
+
+
+def _pipe(data):
+    """
+    Gets a non-seekable file object that reads `data`
+    """
+    read_fd, write_fd = os.pipe()
+    os.write(write_fd, data)
+    os.close(write_fd)
+    return os.fdopen(read_fd, "rb")
+
+
+class ClientTest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.received = []
+        self.bodies = []
+
+        async def handler(request):
+            self.bodies.append(await request.read())
+            if request.match_info["name"] == "rl":
+                return web.json_response({"retry_after": 0, "message": "rate limited"}, status=429)
+            # slower than a refused connection, so the failing url raises first
+            await asyncio.sleep(0.2)
+            self.received.append(request.path)
+            return web.json_response({"id": "1"})
+
+        app = web.Application()
+        app.router.add_post("/{name}", handler)
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, "127.0.0.1", 0)
+        await site.start()
+        port = self.runner.addresses[0][1]
+        self.base_url = "http://127.0.0.1:{}".format(port)
+
+    async def asyncTearDown(self):
+        await self.runner.cleanup()
+
+    async def test_failing_url_waits_for_the_others(self):
+        webhook = Discohook(
+            url=["http://127.0.0.1:1/x", self.base_url + "/a", self.base_url + "/b"],
+            content="test",
+        )
+        with self.assertRaises(aiohttp.ClientConnectionError):
+            await webhook.aexecute()
+        self.assertEqual(sorted(self.received), ["/a", "/b"])
+
+    async def test_pipe_upload(self):
+        webhook = Discohook(url=self.base_url + "/a", content="test")
+        with _pipe(b"sync pipe content") as file:
+            webhook.add_file(file, "sync.txt")
+            response = await asyncio.to_thread(webhook.execute)
+        self.assertEqual(response.status_code, 200)
+        self.assertIn(b"sync pipe content", self.bodies[-1])
+
+        webhook = Discohook(url=self.base_url + "/a", content="test")
+        with _pipe(b"async pipe content") as file:
+            webhook.add_file(file, "async.txt")
+            response = await webhook.aexecute()
+        self.assertEqual(response.status_code, 200)
+        self.assertIn(b"async pipe content", self.bodies[-1])
+
+    async def test_pipe_is_sent_once(self):
+        webhook = Discohook(url=[self.base_url + "/a", self.base_url + "/b"], content="test")
+        with _pipe(b"content") as file:
+            webhook.add_file(file, "pipe.txt")
+            with self.assertRaises(ValueError):
+                await webhook.aexecute()
+            with self.assertRaises(ValueError):
+                await asyncio.to_thread(webhook.execute)
+        self.assertEqual(self.bodies, [])
+
+        webhook = Discohook(url=self.base_url + "/rl", content="test", rate_limit_retry=True)
+        with _pipe(b"content") as file:
+            webhook.add_file(file, "pipe.txt")
+            response = await webhook.aexecute()
+        self.assertEqual(response.status_code, 429)
+        self.assertEqual(len(self.bodies), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()